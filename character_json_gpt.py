@@ -4,7 +4,9 @@ Character JSON Image Tests
 Extract from: character_json.ipynb
 """
 
+import functools
 import json
+import os
 
 from image_gen_helper import (
     ensure_output_dir,
@@ -12,6 +14,45 @@ from image_gen_helper import (
     get_openai_client,
 )
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+
+CHAR_JSON_PATH = "paladin_pirate_barista.json"
+
+# Prompt 1: Basic Vanity Fair cover
+_PROMPT1_TEMPLATE = """
+Generate a photo featuring the specified person. The photo is taken for a Vanity Fair cover profile of the person. Do not include any logos, text, or watermarks.
+---
+{char_json}
+"""
+
+# Prompt 2: Detailed with camera specs
+_PROMPT2_TEMPLATE = """
+Generate a photo featuring a closeup of the specified human person. The person is standing rotated 20 degrees making their `signature_pose` and their complete body is visible in the photo at the `nationality_origin` location. The photo is taken with a Canon EOS 90D DSLR camera for a Vanity Fair cover profile of the person with real-world natural lighting and real-world natural uniform depth of field (DOF). Do not include any logos, text, or watermarks.
+
+The photo MUST accurately include and display all of the person's attributes from this JSON:
+---
+{char_json}
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def _load_char_json_str(path: str, mtime: float) -> str:
+    """Load and pretty-print the character JSON; mtime is only part of the cache key."""
+    with open(path, "r", encoding="utf-8") as f:
+        char_json = json.load(f)
+    if orjson is not None:
+        return orjson.dumps(char_json, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(char_json, indent=2, ensure_ascii=False, separators=(",", ": "))
+
+
+def load_char_json_str(path: str = CHAR_JSON_PATH) -> str:
+    """Return the pretty-printed character JSON, reusing the cached copy until the file changes."""
+    return _load_char_json_str(path, os.path.getmtime(path))
+
 
 def main():
     # Initialize
@@ -19,17 +60,10 @@ def main():
     output_dir = ensure_output_dir()
 
     # Load the character JSON
-    with open("paladin_pirate_barista.json", "r") as f:
-        char_json = json.load(f)
-
-    char_json_str = json.dumps(char_json, indent=2)
+    char_json_str = load_char_json_str()
 
     # Prompt 1: Basic Vanity Fair cover
-    prompt1 = f"""
-Generate a photo featuring the specified person. The photo is taken for a Vanity Fair cover profile of the person. Do not include any logos, text, or watermarks.
----
-{char_json_str}
-"""
+    prompt1 = _PROMPT1_TEMPLATE.format(char_json=char_json_str)
 
     print("Generating: Character JSON Attempt #1 (Basic Vanity Fair cover)...")
     # Switched to auto size as it was cutting off the top of the person's head
@@ -46,13 +80,7 @@ Generate a photo featuring the specified person. The photo is taken for a Vanity
     print()
 
     # Prompt 2: Detailed with camera specs
-    prompt2 = f"""
-Generate a photo featuring a closeup of the specified human person. The person is standing rotated 20 degrees making their `signature_pose` and their complete body is visible in the photo at the `nationality_origin` location. The photo is taken with a Canon EOS 90D DSLR camera for a Vanity Fair cover profile of the person with real-world natural lighting and real-world natural uniform depth of field (DOF). Do not include any logos, text, or watermarks.
-
-The photo MUST accurately include and display all of the person's attributes from this JSON:
----
-{char_json_str}
-"""
+    prompt2 = _PROMPT2_TEMPLATE.format(char_json=char_json_str)
     print("Generating: Character JSON Attempt #2 (Detailed with camera specs)...")
     generate_multiple_images(
         client=client,
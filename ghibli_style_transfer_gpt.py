@@ -11,6 +11,7 @@ from pathlib import Path
 
 from image_gen_helper import (
     ensure_output_dir,
+    find_images,
     generate_multiple_with_image_input,
     get_openai_client,
 )
@@ -21,20 +22,12 @@ def main():
     prompt = "Make me into Studio Ghibli."
 
     # Check if input image exists - try multiple locations
-    possible_paths = [
-        Path("prompt_imgs/max_selfie.webp"),
-        Path("input_images/selfie.jpg"),
-        Path("input_images/selfie.png"),
-        Path("input_images/selfie.webp"),
-        Path("selfie.jpg"),
-        Path("selfie.png"),
-    ]
-
-    input_image_path = None
-    for path in possible_paths:
-        if path.exists():
-            input_image_path = path
-            break
+    candidates = (
+        find_images([Path("prompt_imgs")], "max_selfie", suffixes=(".webp",), exact_stem=True)
+        or find_images([Path("input_images")], "selfie", exact_stem=True)
+        or find_images([Path(".")], "selfie", suffixes=(".jpg", ".png"), exact_stem=True)
+    )
+    input_image_path = candidates[0] if candidates else None
 
     if not input_image_path:
         print("=" * 80)
@@ -9,29 +9,316 @@ gpt-image-1 is OpenAI's most advanced image generation model that supports:
 - Transparent backgrounds
 """
 
+import asyncio
+import atexit
 import base64
+import contextlib
+import functools
+import hashlib
+import importlib.util
 import os
-import urllib.request
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import random
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Union
 
+import httpx
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    AsyncOpenAI,
+    BadRequestError,
+    InternalServerError,
+    OpenAI,
+    RateLimitError,
+)
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Connection pool and timeout for the HTTP clients behind the OpenAI clients. When
+# h2 is installed (httpx[http2]) the clients speak HTTP/2, so concurrent requests
+# share one multiplexed connection instead of each paying for its own TLS handshake.
+# Reads keep the SDK's 600s timeout: complex generations can take minutes, and a
+# timed-out request is retried (and possibly billed) again.
+_HTTP2 = importlib.util.find_spec("h2") is not None
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+_HTTP_TIMEOUT = httpx.Timeout(600.0, connect=10.0)
 
-def get_openai_client() -> OpenAI:
-    """Initialize and return an OpenAI client."""
+# Concurrency used until a response reveals the account's request rate limit;
+# OPENAI_MAX_CONCURRENCY in the environment overrides both
+DEFAULT_MAX_WORKERS = 5
+_MAX_DETECTED_WORKERS = 50
+# Detected concurrency per model, since each model (and endpoint) has its own limits
+_detected_max_workers: dict[str, int] = {}
+
+# Dedicated threads for saving images, so disk writes never wait behind (or hold
+# up) the default executor and overlap with the next API request
+_writer_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="img-writer")
+atexit.register(_writer_pool.shutdown)
+
+# On-disk cache of generated images, keyed by a hash of the generation parameters
+CACHE_DIR = Path.home() / ".cache" / "nano-banana"
+
+# Conservative tier-1 rate limits per model: (requests per minute, tokens per minute).
+# A token limit of None means the model is only limited by requests.
+DEFAULT_RATE_LIMITS: dict[str, tuple[int, Optional[int]]] = {
+    "gpt-image-1": (5, 100_000),
+    "dall-e-3": (500, None),
+    "dall-e-2": (500, None),
+}
+
+# Transient API errors worth retrying; anything else (e.g. BadRequestError for a
+# moderation rejection, AuthenticationError) fails fast
+_RETRYABLE_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
+
+# MIME types for input images sent to the Responses API as data URLs
+_IMAGE_MIME_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".webp": "image/webp",
+    ".gif": "image/gif",
+}
+
+# Base64 slice size for streaming decodes to disk; a multiple of 4 so each slice
+# decodes on its own
+_B64_CHUNK_SIZE = 64 * 1024
+
+# Chunk size for streaming image downloads to disk
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Models that accept n > 1 in a single Image API request, with their per-request maximum
+_MULTI_IMAGE_MODELS = {"dall-e-2": 10}
+
+# gpt-image-1 output tokens per image by quality: (square, portrait/landscape)
+_IMAGE_OUTPUT_TOKENS = {
+    "low": (272, 408),
+    "medium": (1056, 1584),
+    "high": (4160, 6240),
+}
+
+
+def _get_api_key() -> str:
+    """Read the OpenAI API key from the environment."""
     api_key = os.environ.get("OPENAI_API_KEY")
     if not api_key:
         raise ValueError(
             "OPENAI_API_KEY not found in environment or .env file. "
             "Please add OPENAI_API_KEY=your-key-here to your .env file."
         )
-    return OpenAI(api_key=api_key)
+    return api_key
+
+
+@functools.lru_cache(maxsize=1)
+def get_openai_client() -> OpenAI:
+    """
+    Initialize and return an OpenAI client, shared for the whole process.
+
+    SDK retries are disabled: the helpers retry transient errors themselves, with
+    backoff and rate limiting, and SDK retries would multiply every attempt.
+    """
+    return OpenAI(api_key=_get_api_key(), max_retries=0)
+
+
+def get_async_openai_client(client: Optional[OpenAI] = None) -> AsyncOpenAI:
+    """
+    Initialize and return an AsyncOpenAI client.
+
+    Unlike get_openai_client() this is not cached: an async client's connections
+    belong to the event loop they were opened on. Use it as an async context manager
+    so it gets closed. The sync wrappers instead share one client per API key and
+    base URL on a single event loop, so a script's batches reuse warm connections.
+    As with get_openai_client(), SDK retries are disabled in favour of the helpers' own.
+
+    Args:
+        client: Optional sync client whose API key and base URL should be reused
+
+    Returns:
+        AsyncOpenAI client instance
+    """
+    http_client = httpx.AsyncClient(http2=_HTTP2, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+    if client is not None:
+        return AsyncOpenAI(
+            api_key=client.api_key, base_url=client.base_url, max_retries=0, http_client=http_client
+        )
+    return AsyncOpenAI(api_key=_get_api_key(), max_retries=0, http_client=http_client)
+
+
+_event_loop: Optional[asyncio.AbstractEventLoop] = None
+_shared_async_clients: dict[tuple[str, str], AsyncOpenAI] = {}
+
+
+def _close_shared_loop() -> None:
+    for async_client in _shared_async_clients.values():
+        _event_loop.run_until_complete(async_client.close())
+    _shared_async_clients.clear()
+    _event_loop.close()
+
+
+def _run_with_async_client(client: OpenAI, run):
+    """
+    Run run(async_client) to completion on the event loop shared by the sync wrappers.
+
+    The loop and one AsyncOpenAI client per API key and base URL live for the whole
+    process and are closed at exit, so consecutive batches reuse the same pooled
+    connections instead of reconnecting each time.
+    """
+    global _event_loop
+    if _event_loop is None:
+        _event_loop = asyncio.new_event_loop()
+        atexit.register(_close_shared_loop)
+    key = (client.api_key, str(client.base_url))
+    if key not in _shared_async_clients:
+        _shared_async_clients[key] = get_async_openai_client(client)
+    return _event_loop.run_until_complete(run(_shared_async_clients[key]))
+
+
+class RateLimiter:
+    """
+    Shared requests-per-minute and tokens-per-minute budget for async requests.
+
+    Capacity starts full and refills continuously at limit/60 per second, following
+    the OpenAI cookbook's api_request_parallel_processor.py. Callers await acquire()
+    before each request and are held back (in FIFO order) until the budget allows it.
+    """
+
+    def __init__(
+        self,
+        max_requests_per_minute: float,
+        max_tokens_per_minute: Optional[float] = None,
+    ):
+        self.max_requests_per_minute = max_requests_per_minute
+        self.max_tokens_per_minute = max_tokens_per_minute
+        self.available_request_capacity = max_requests_per_minute
+        self.available_token_capacity = max_tokens_per_minute or 0
+        self.last_update_time = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add the capacity that accrued since the last update."""
+        now = time.monotonic()
+        elapsed = now - self.last_update_time
+        self.available_request_capacity = min(
+            self.max_requests_per_minute,
+            self.available_request_capacity + elapsed * self.max_requests_per_minute / 60,
+        )
+        if self.max_tokens_per_minute:
+            self.available_token_capacity = min(
+                self.max_tokens_per_minute,
+                self.available_token_capacity + elapsed * self.max_tokens_per_minute / 60,
+            )
+        self.last_update_time = now
+
+    async def acquire(self, estimated_tokens: int = 0) -> None:
+        """
+        Wait until one request and the estimated tokens fit in the budget, then consume them.
+
+        Args:
+            estimated_tokens: Estimated tokens the request will use (default: 0)
+        """
+        if self.max_tokens_per_minute:
+            # A single request can never need more than the whole bucket
+            estimated_tokens = min(estimated_tokens, self.max_tokens_per_minute)
+
+        async with self._lock:
+            while True:
+                self._refill()
+                request_deficit = 1 - self.available_request_capacity
+                token_deficit = (
+                    estimated_tokens - self.available_token_capacity
+                    if self.max_tokens_per_minute
+                    else 0
+                )
+                if request_deficit <= 0 and token_deficit <= 0:
+                    self.available_request_capacity -= 1
+                    if self.max_tokens_per_minute:
+                        self.available_token_capacity -= estimated_tokens
+                    return
+
+                wait = request_deficit * 60 / self.max_requests_per_minute
+                if token_deficit > 0:
+                    wait = max(wait, token_deficit * 60 / self.max_tokens_per_minute)
+                await asyncio.sleep(wait)
+
+
+def resolve_max_workers(max_workers: Optional[int] = None, model: Optional[str] = None) -> int:
+    """
+    Pick the number of concurrent requests to allow.
+
+    Order of precedence: the explicit max_workers argument, the OPENAI_MAX_CONCURRENCY
+    environment variable, a value derived from the x-ratelimit-limit-requests header of
+    an earlier response for the same model (half the per-minute limit, capped at 50),
+    then DEFAULT_MAX_WORKERS.
+
+    Args:
+        max_workers: Explicit override (default: None)
+        model: Model the requests will use, to pick its detected limit (default: None)
+
+    Returns:
+        Number of concurrent requests
+
+    Raises:
+        ValueError: If OPENAI_MAX_CONCURRENCY is not a whole number of at least 1
+    """
+    if max_workers:
+        return max_workers
+    env_value = os.environ.get("OPENAI_MAX_CONCURRENCY")
+    if env_value:
+        try:
+            env_workers = int(env_value)
+        except ValueError:
+            env_workers = 0
+        if env_workers < 1:
+            raise ValueError(
+                f"OPENAI_MAX_CONCURRENCY must be a whole number of at least 1, got {env_value!r}"
+            )
+        return env_workers
+    return _detected_max_workers.get(model) or DEFAULT_MAX_WORKERS
+
+
+def _regenerate_requested() -> bool:
+    """Whether REGENERATE=1 in the environment asks for every image to be generated anew."""
+    return os.environ.get("REGENERATE") == "1"
+
+
+def _keep_existing(output_path: Path, skip_existing: bool) -> bool:
+    """Whether an existing output file should be kept; REGENERATE=1 in the environment forces regeneration."""
+    return skip_existing and not _regenerate_requested() and output_path.exists()
+
+
+def _record_rate_limits(raw_response, model: str):
+    """Remember model's request limit from a raw response's headers and return the parsed response."""
+    rpm_limit = raw_response.headers.get("x-ratelimit-limit-requests")
+    if rpm_limit and rpm_limit.isdigit():
+        _detected_max_workers[model] = max(1, min(_MAX_DETECTED_WORKERS, int(rpm_limit) // 2))
+    return raw_response.parse()
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with jitter for the given (zero-based) retry attempt, capped at 60s."""
+    return min(60, 2**attempt + random.random())
+
+
+def estimate_image_tokens(prompt: str, size: str = "1024x1024", quality: str = "auto") -> int:
+    """
+    Roughly estimate the tokens a gpt-image-1 generation will use.
+
+    Args:
+        prompt: Text prompt for image generation
+        size: Image size (default: "1024x1024")
+        quality: Image quality - "low", "medium", "high", or "auto" (default: "auto")
+
+    Returns:
+        Estimated prompt tokens plus image output tokens
+    """
+    # "auto" may pick any quality or size, so budget for the most expensive one
+    square, rectangular = _IMAGE_OUTPUT_TOKENS.get(quality, _IMAGE_OUTPUT_TOKENS["high"])
+    image_tokens = square if size == "1024x1024" else rectangular
+    return len(prompt) // 4 + image_tokens
 
 
 def ensure_output_dir(output_dir: str = "generated_imgs_gpt") -> Path:
@@ -41,6 +328,47 @@ def ensure_output_dir(output_dir: str = "generated_imgs_gpt") -> Path:
     return dir_path
 
 
+def find_images(
+    dirs: list[Union[str, Path]],
+    stem_prefix: str,
+    suffixes: tuple[str, ...] = (".jpg", ".png", ".webp"),
+    exact_stem: bool = False,
+) -> list[Path]:
+    """
+    Find image files whose names start with a prefix, scanning each directory once.
+
+    Matching is case-sensitive, like Path.glob, for both the name and the suffix.
+
+    Args:
+        dirs: Directories to search; missing directories are skipped
+        stem_prefix: Required file name prefix (e.g. "ugly_sonic")
+        suffixes: Accepted file extensions (default: (".jpg", ".png", ".webp"))
+        exact_stem: Whether the name without its extension must equal stem_prefix
+            rather than just start with it (default: False)
+
+    Returns:
+        Matching paths in the order of dirs, sorted by name within each directory
+    """
+    found = []
+    for directory in dirs:
+        if not os.path.isdir(directory):
+            continue
+        with os.scandir(directory) as entries:
+            matches = [
+                Path(entry.path)
+                for entry in entries
+                if entry.is_file()
+                and entry.name.endswith(suffixes)
+                and (
+                    os.path.splitext(entry.name)[0] == stem_prefix
+                    if exact_stem
+                    else entry.name.startswith(stem_prefix)
+                )
+            ]
+        found.extend(sorted(matches))
+    return found
+
+
 def encode_image_to_base64(image_path: Union[str, Path]) -> str:
     """
     Encode an image file to base64 string.
@@ -55,79 +383,292 @@ def encode_image_to_base64(image_path: Union[str, Path]) -> str:
         return base64.b64encode(image_file.read()).decode("utf-8")
 
 
-def generate_and_save_image(
-    client: OpenAI,
+def encode_image_to_data_url(image_path: Union[str, Path]) -> str:
+    """
+    Encode an image file to a base64 data URL with a MIME type matching its extension.
+
+    Args:
+        image_path: Path to the image file
+
+    Returns:
+        Data URL like "data:image/webp;base64,..." (unknown extensions fall back to image/jpeg)
+    """
+    mime_type = _IMAGE_MIME_TYPES.get(Path(image_path).suffix.lower(), "image/jpeg")
+    return f"data:{mime_type};base64,{encode_image_to_base64(image_path)}"
+
+
+async def _run_in_writer(func, *args) -> None:
+    """Run a blocking file write on the dedicated writer threads."""
+    await asyncio.get_running_loop().run_in_executor(_writer_pool, func, *args)
+
+
+@contextlib.contextmanager
+def _atomic_write(output_path: Union[str, Path]):
+    """
+    Open a temporary file next to output_path and move it into place on success.
+
+    The temporary file is in the same directory, so os.replace is atomic: readers
+    and re-runs see either the previous file or the complete new one, never a
+    truncated image. On any error the temporary file is removed.
+    """
+    output_path = Path(output_path)
+    # Not tempfile.mkstemp, which would leave the final file readable by the owner only
+    tmp_path = output_path.with_name(f".{output_path.name}.{os.urandom(4).hex()}.tmp")
+    f = open(tmp_path, "xb")
+    try:
+        with f:
+            yield f
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
+
+
+def _copy_file_atomic(source: Path, destination: Path) -> None:
+    """Copy source to destination through _atomic_write()."""
+    with open(source, "rb") as src, _atomic_write(destination) as dst:
+        shutil.copyfileobj(src, dst)
+
+
+def write_base64_to_file(b64_data: str, output_path: Union[str, Path]) -> None:
+    """
+    Decode base64 image data straight to a file in fixed-size slices.
+
+    Only one slice is decoded at a time, so a full decoded copy of the image
+    is never held in memory next to the base64 string. The file is replaced
+    atomically once fully written.
+
+    Args:
+        b64_data: Base64-encoded image data
+        output_path: Path where the decoded image should be saved
+    """
+    with _atomic_write(output_path) as f:
+        for start in range(0, len(b64_data), _B64_CHUNK_SIZE):
+            f.write(base64.b64decode(b64_data[start:start + _B64_CHUNK_SIZE]))
+
+
+def new_download_client(timeout: float = 60) -> httpx.AsyncClient:
+    """Create an HTTP client for download_to_file(), to be shared by a batch of downloads."""
+    return httpx.AsyncClient(http2=_HTTP2, timeout=timeout)
+
+
+async def download_to_file(
+    url: str,
+    output_path: Union[str, Path],
+    http_client: Optional[httpx.AsyncClient] = None,
+) -> None:
+    """
+    Stream a URL to a file without blocking the event loop.
+
+    The file is replaced atomically once the download completes.
+
+    Args:
+        url: URL to download
+        output_path: Path where the downloaded file should be saved
+        http_client: Client from new_download_client() to reuse across downloads;
+            a one-off client is created if not given (default: None)
+    """
+    if http_client is None:
+        async with new_download_client() as http_client:
+            return await download_to_file(url, output_path, http_client)
+
+    async with http_client.stream("GET", url) as response:
+        response.raise_for_status()
+        with _atomic_write(output_path) as f:
+            async for chunk in response.aiter_bytes(_DOWNLOAD_CHUNK_SIZE):
+                await _run_in_writer(f.write, chunk)
+
+
+def _cache_path(prompt: str, **params) -> Path:
+    """
+    Return the cache file for an image generated from prompt with the given params.
+
+    The key is a sha256 over the prompt and the sorted params (e.g. model, size,
+    quality, background, seed), so any change to them maps to a different file.
+    """
+    key = "|".join([prompt, *(f"{name}={params[name]}" for name in sorted(params))])
+    return CACHE_DIR / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.png"
+
+
+async def _restore_from_cache(cache_path: Path, output_path: Path) -> bool:
+    """Copy a cached image to output_path, returning whether there was a cache hit."""
+    if not cache_path.exists():
+        return False
+    await _run_in_writer(_copy_file_atomic, cache_path, output_path)
+    return True
+
+
+async def _store_in_cache(output_path: Path, cache_path: Path) -> None:
+    """Copy a freshly generated image into the cache."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    await _run_in_writer(_copy_file_atomic, output_path, cache_path)
+
+
+def _build_image_params(
+    prompt: str,
+    size: str,
+    model: str,
+    quality: str,
+    background: str,
+    n: int = 1,
+) -> dict:
+    """Build Image API params, only including quality/background if the model supports them."""
+    params = {
+        "model": model,
+        "prompt": prompt,
+        "n": n,
+        "size": size,
+    }
+
+    # gpt-image-1 supports these params, dall-e models might not
+    if model == "gpt-image-1":
+        params["quality"] = quality
+        params["background"] = background
+
+    return params
+
+
+async def _with_retries(
+    make_request,
+    max_retries: int = 5,
+    limiter: Optional[RateLimiter] = None,
+    estimated_tokens: int = 0,
+):
+    """
+    Await make_request(), retrying transient errors with backoff.
+
+    This is the only retry policy: the OpenAI clients are built with max_retries=0.
+    """
+    last_error = None
+
+    for attempt in range(max_retries + 1):
+        try:
+            if limiter:
+                await limiter.acquire(estimated_tokens)
+            return await make_request()
+
+        except _RETRYABLE_ERRORS as ex:
+            last_error = ex
+            if attempt < max_retries:
+                delay = _backoff_delay(attempt)
+                print(f"  Attempt {attempt + 1} failed ({type(ex).__name__}), retrying in {delay:.1f}s...")
+                await asyncio.sleep(delay)
+            continue
+
+    # All retries exhausted
+    print(f"  ERROR: Failed to generate image after {max_retries + 1} attempts: {last_error}")
+    raise last_error
+
+
+def _describe_failure(error: Optional[BaseException]) -> str:
+    """Describe why an image failed, noting whether it was retried first."""
+    if error is None:
+        return "failed"
+    reason = f"{type(error).__name__}: {error}"
+    if isinstance(error, _RETRYABLE_ERRORS):
+        return f"failed after retries ({reason})"
+    return f"failed ({reason})"
+
+
+async def _request_images(
+    client: AsyncOpenAI,
+    params: dict,
+    max_retries: int = 5,
+    limiter: Optional[RateLimiter] = None,
+):
+    """Call the Image API, retrying transient errors with backoff."""
+    estimated_tokens = params["n"] * estimate_image_tokens(
+        params["prompt"], params["size"], params.get("quality", "auto")
+    )
+
+    async def make_request():
+        return _record_rate_limits(
+            await client.images.with_raw_response.generate(**params), params["model"]
+        )
+
+    return await _with_retries(make_request, max_retries, limiter, estimated_tokens)
+
+
+async def _save_image(
+    image, output_path: Path, http_client: Optional[httpx.AsyncClient] = None
+) -> str:
+    """Save one item of an Image API response, returning its URL or "base64_data_saved"."""
+    # gpt-image-1 returns base64 data, dall-e returns URLs
+    if image.b64_json:
+        # Decode and save base64 image on the writer threads
+        await _run_in_writer(write_base64_to_file, image.b64_json, output_path)
+        return "base64_data_saved"
+    elif image.url:
+        # Download from URL
+        await download_to_file(image.url, output_path, http_client)
+        return image.url
+    else:
+        raise ValueError("API returned neither URL nor base64 data")
+
+
+async def generate_and_save_image(
+    client: AsyncOpenAI,
     prompt: str,
     output_path: Path,
     size: str = "1024x1024",
     model: str = "gpt-image-1",
     quality: str = "auto",
     background: str = "auto",
-    max_retries: int = 2,
+    max_retries: int = 5,
+    limiter: Optional[RateLimiter] = None,
+    seed: Optional[int] = None,
+    use_cache: bool = True,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    http_client: Optional[httpx.AsyncClient] = None,
 ) -> str:
     """
     Generate a single image and save it to the specified path using the Image API.
 
+    Results are cached under CACHE_DIR, keyed by model, prompt, size, quality,
+    background and seed; a cache hit copies the cached file instead of calling the API.
+
     Args:
-        client: OpenAI client instance
+        client: AsyncOpenAI client instance
         prompt: Text prompt for image generation
         output_path: Path where the image should be saved
         size: Image size (default: "1024x1024")
         model: Model to use (default: "gpt-image-1")
         quality: Image quality - "low", "medium", "high", or "auto" (default: "auto")
         background: Background type - "transparent", "opaque", or "auto" (default: "auto")
-        max_retries: Maximum number of retries on failure (default: 2)
+        max_retries: Maximum number of retries on transient failures (default: 5)
+        limiter: Optional rate limiter to wait on before each request
+        seed: Cache key component to tell variants of the same prompt apart; the Image
+            API has no seed parameter, so it does not change the request (default: None)
+        use_cache: Whether to read from and write to the image cache; REGENERATE=1 in
+            the environment skips reads, so the cache is refreshed (default: True)
+        semaphore: Optional semaphore held only while the API request is in flight, so
+            saving the result does not block the next request (default: None)
+        http_client: Optional client from new_download_client() for URL results
+            (default: None)
 
     Returns:
-        The URL or base64 data of the generated image
+        The URL or base64 data of the generated image, or "cached" on a cache hit
     """
-    last_error = None
-
-    for attempt in range(max_retries + 1):
-        try:
-            # Build params - only include quality/background if model supports them
-            params = {
-                "model": model,
-                "prompt": prompt,
-                "n": 1,
-                "size": size,
-            }
-
-            # gpt-image-1 supports these params, dall-e models might not
-            if model == "gpt-image-1":
-                params["quality"] = quality
-                params["background"] = background
-
-            response = client.images.generate(**params)
-
-            # gpt-image-1 returns base64 data, dall-e returns URLs
-            if response.data[0].b64_json:
-                # Decode and save base64 image
-                image_data = base64.b64decode(response.data[0].b64_json)
-                with open(output_path, "wb") as f:
-                    f.write(image_data)
-                return "base64_data_saved"
-            elif response.data[0].url:
-                # Download from URL
-                image_url = response.data[0].url
-                urllib.request.urlretrieve(image_url, output_path)
-                return image_url
-            else:
-                raise ValueError("API returned neither URL nor base64 data")
+    cache_path = _cache_path(
+        prompt, model=model, size=size, quality=quality, background=background, seed=seed
+    )
+    use_cached = use_cache and not _regenerate_requested()
+    if use_cached and await _restore_from_cache(cache_path, output_path):
+        return "cached"
 
-        except Exception as ex:
-            last_error = ex
-            if attempt < max_retries:
-                print(f"  Attempt {attempt + 1} failed, retrying...")
-            continue
+    params = _build_image_params(prompt, size, model, quality, background)
+    async with semaphore or contextlib.nullcontext():
+        response = await _request_images(client, params, max_retries=max_retries, limiter=limiter)
+    result = await _save_image(response.data[0], output_path, http_client)
 
-    # All retries exhausted
-    print(f"  ERROR: Failed to generate image after {max_retries + 1} attempts: {last_error}")
-    raise last_error
+    if use_cache:
+        await _store_in_cache(output_path, cache_path)
+    return result
 
 
-def generate_multiple_images(
-    client: OpenAI,
+async def generate_multiple_images_async(
+    client: AsyncOpenAI,
     prompt: str,
     base_name: str,
     output_dir: Path,
@@ -137,13 +678,23 @@ def generate_multiple_images(
     quality: str = "auto",
     background: str = "auto",
     verbose: bool = True,
-    max_workers: int = 5,
+    max_workers: Optional[int] = None,
+    limiter: Optional[RateLimiter] = None,
+    use_cache: bool = True,
+    skip_existing: bool = True,
+    semaphore: Optional[asyncio.Semaphore] = None,
 ) -> list[str]:
     """
-    Generate multiple images from the same prompt in parallel.
+    Generate multiple images from the same prompt concurrently.
+
+    How the images are requested depends on the model:
+        - dall-e-2: up to 10 images per request via the n parameter
+        - gpt-image-1, dall-e-3: one image per request, with requests running concurrently
+          (dall-e-3 only accepts n=1; gpt-image-1 keeps one request per image so each
+          variant is retried on its own)
 
     Args:
-        client: OpenAI client instance
+        client: AsyncOpenAI client instance
         prompt: Text prompt for image generation
         base_name: Base name for output files (will be appended with _1, _2, etc.)
         output_dir: Directory where images should be saved
@@ -153,7 +704,14 @@ def generate_multiple_images(
         quality: Image quality - "low", "medium", "high", or "auto" (default: "auto")
         background: Background type - "transparent", "opaque", or "auto" (default: "auto")
         verbose: Whether to print progress information (default: True)
-        max_workers: Maximum number of parallel workers (default: 5)
+        max_workers: Maximum number of concurrent requests (default: resolve_max_workers())
+        limiter: Optional rate limiter shared with other concurrent batches
+        use_cache: Whether to reuse cached images; each variant index is cached
+            separately, and REGENERATE=1 in the environment skips reads (default: True)
+        skip_existing: Whether to keep output files left by a previous run instead of
+            regenerating them; REGENERATE=1 in the environment overrides it (default: True)
+        semaphore: Optional semaphore shared with other concurrent batches to cap their
+            combined concurrency; max_workers is ignored when it is given (default: None)
 
     Returns:
         List of URLs for all generated images
@@ -161,34 +719,177 @@ def generate_multiple_images(
     if verbose:
         print(f"  Generating {count} images in parallel...")
 
-    def generate_single(index: int) -> tuple[int, str | None]:
-        """Helper function to generate a single image"""
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(resolve_max_workers(max_workers, model))
+
+    def cache_path(index: int) -> Path:
+        """Cache file for one variant, using its index as the seed"""
+        return _cache_path(
+            prompt, model=model, size=size, quality=quality, background=background, seed=index
+        )
+
+    def report(index: int, result: str | None, error: Optional[BaseException] = None) -> None:
+        """Print the outcome of a single image, with the reason if it failed"""
+        if not verbose:
+            return
+        if result:
+            print(f"  ✓ {base_name} image {index}/{count} completed")
+        else:
+            print(f"  ✗ {base_name} image {index}/{count} {_describe_failure(error)}")
+
+    async def generate_single(index: int) -> str | None:
+        """Helper coroutine to generate a single image"""
         output_path = output_dir / f"{base_name}_{index}.png"
+        result = None
         try:
-            result = generate_and_save_image(
-                client, prompt, output_path, size, model, quality, background
+            result = await generate_and_save_image(
+                client, prompt, output_path, size, model, quality, background,
+                limiter=limiter,
+                seed=index,
+                use_cache=use_cache,
+                semaphore=semaphore,
+                http_client=download_client,
             )
-            if verbose:
-                print(f"  ✓ Image {index}/{count} completed")
-            return (index, result)
-        except Exception:
-            if verbose:
-                print(f"  ✗ Image {index}/{count} failed after retries")
-            return (index, None)
+        except Exception as ex:
+            report(index, None, ex)
+            return None
+        report(index, result)
+        return result
 
-    results = {}
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all tasks
-        futures = {executor.submit(generate_single, i): i for i in range(1, count + 1)}
+    async def save_single(index: int, image) -> str | None:
+        """Helper coroutine to save one image from a batched response"""
+        output_path = output_dir / f"{base_name}_{index}.png"
+        result = None
+        try:
+            result = await _save_image(image, output_path, download_client)
+            if use_cache:
+                await _store_in_cache(output_path, cache_path(index))
+        except Exception as ex:
+            report(index, None, ex)
+            return None
+        report(index, result)
+        return result
 
-        # Collect results as they complete
-        for future in as_completed(futures):
-            index, result = future.result()
-            if result:
-                results[index] = result
+    async def restore_single(index: int) -> str | None:
+        """Helper coroutine to restore one image from the cache, if present"""
+        output_path = output_dir / f"{base_name}_{index}.png"
+        if not await _restore_from_cache(cache_path(index), output_path):
+            return None
+        report(index, "cached")
+        return "cached"
 
-    # Return results in order
-    return [results[i] for i in range(1, count + 1) if i in results]
+    async def generate_batch(indices: list[int]) -> list[str | None]:
+        """Helper coroutine to generate several images with one n > 1 request"""
+        params = _build_image_params(prompt, size, model, quality, background, n=len(indices))
+        async with semaphore:
+            try:
+                response = await _request_images(client, params, limiter=limiter)
+            except Exception as ex:
+                for index in indices:
+                    report(index, None, ex)
+                return [None] * len(indices)
+        # The API may return fewer items than requested; those variants failed
+        images = response.data or []
+        for index in indices[len(images):]:
+            report(index, None, ValueError("not returned by the API"))
+        saved = await asyncio.gather(*(
+            save_single(index, image) for index, image in zip(indices, images)
+        ))
+        return saved + [None] * (len(indices) - len(saved))
+
+    # One download client for the whole batch, so URL results share its connections
+    async with new_download_client() as download_client:
+        # Leave images from previous runs alone
+        results: list[str | None] = [None] * count
+        for index in range(1, count + 1):
+            if _keep_existing(output_dir / f"{base_name}_{index}.png", skip_existing):
+                results[index - 1] = "cached"
+                if verbose:
+                    print(f"  - {base_name} image {index}/{count} already exists, skipping")
+        pending = [i for i in range(1, count + 1) if not results[i - 1]]
+
+        # gather preserves submission order, so results line up with indices
+        batch_size = _MULTI_IMAGE_MODELS.get(model, 1)
+        if batch_size > 1:
+            # Only request the variants that are not already cached
+            if use_cache and not _regenerate_requested():
+                restored = await asyncio.gather(*(restore_single(i) for i in pending))
+                for index, result in zip(pending, restored):
+                    results[index - 1] = result
+                pending = [i for i in pending if not results[i - 1]]
+            batches = [pending[start:start + batch_size] for start in range(0, len(pending), batch_size)]
+            batch_results = await asyncio.gather(*(generate_batch(indices) for indices in batches))
+            for indices, batch in zip(batches, batch_results):
+                for index, result in zip(indices, batch):
+                    results[index - 1] = result
+        else:
+            generated = await asyncio.gather(*(generate_single(i) for i in pending))
+            for index, result in zip(pending, generated):
+                results[index - 1] = result
+    return [result for result in results if result]
+
+
+def generate_multiple_images(
+    client: OpenAI,
+    prompt: str,
+    base_name: str,
+    output_dir: Path,
+    count: int = 5,
+    size: str = "1024x1024",
+    model: str = "gpt-image-1",
+    quality: str = "auto",
+    background: str = "auto",
+    verbose: bool = True,
+    max_workers: Optional[int] = None,
+    use_cache: bool = True,
+    skip_existing: bool = True,
+) -> list[str]:
+    """
+    Generate multiple images from the same prompt in parallel.
+
+    Synchronous wrapper around generate_multiple_images_async(); requests are
+    issued through an AsyncOpenAI client configured like the given client. See
+    generate_multiple_images_async() for which models batch images per request.
+
+    Args:
+        client: OpenAI client instance
+        prompt: Text prompt for image generation
+        base_name: Base name for output files (will be appended with _1, _2, etc.)
+        output_dir: Directory where images should be saved
+        count: Number of images to generate (default: 5)
+        size: Image size (default: "1024x1024")
+        model: Model to use (default: "gpt-image-1")
+        quality: Image quality - "low", "medium", "high", or "auto" (default: "auto")
+        background: Background type - "transparent", "opaque", or "auto" (default: "auto")
+        verbose: Whether to print progress information (default: True)
+        max_workers: Maximum number of concurrent requests (default: resolve_max_workers())
+        use_cache: Whether to reuse cached images; each variant index is cached
+            separately, and REGENERATE=1 in the environment skips reads (default: True)
+        skip_existing: Whether to keep output files left by a previous run instead of
+            regenerating them; REGENERATE=1 in the environment overrides it (default: True)
+
+    Returns:
+        List of URLs for all generated images
+    """
+
+    async def run(async_client: AsyncOpenAI) -> list[str]:
+        return await generate_multiple_images_async(
+            client=async_client,
+            prompt=prompt,
+            base_name=base_name,
+            output_dir=output_dir,
+            count=count,
+            size=size,
+            model=model,
+            quality=quality,
+            background=background,
+            verbose=verbose,
+            max_workers=max_workers,
+            use_cache=use_cache,
+            skip_existing=skip_existing,
+        )
+
+    return _run_with_async_client(client, run)
 
 
 def generate_from_prompt_list(
@@ -200,10 +901,19 @@ def generate_from_prompt_list(
     model: str = "gpt-image-1",
     quality: str = "auto",
     background: str = "auto",
+    max_rpm: Optional[int] = None,
+    max_tpm: Optional[int] = None,
+    use_cache: bool = True,
+    skip_existing: bool = True,
+    max_workers: Optional[int] = None,
 ) -> dict[str, list[str]]:
     """
     Generate multiple images for each prompt in a list.
 
+    All prompts run concurrently and share one RateLimiter and one concurrency
+    limit, so requests are dispatched as fast as the account limits allow instead
+    of hitting 429s.
+
     Args:
         client: OpenAI client instance
         prompts: List of dicts with 'name' and 'prompt' keys
@@ -213,39 +923,96 @@ def generate_from_prompt_list(
         model: Model to use (default: "gpt-image-1")
         quality: Image quality - "low", "medium", "high", or "auto" (default: "auto")
         background: Background type - "transparent", "opaque", or "auto" (default: "auto")
+        max_rpm: Requests per minute budget (default: DEFAULT_RATE_LIMITS for the model)
+        max_tpm: Tokens per minute budget (default: DEFAULT_RATE_LIMITS for the model)
+        use_cache: Whether to reuse cached images instead of calling the API; REGENERATE=1
+            in the environment skips reads (default: True)
+        skip_existing: Whether to keep output files left by a previous run instead of
+            regenerating them; REGENERATE=1 in the environment overrides it (default: True)
+        max_workers: Maximum number of concurrent requests across all prompts
+            (default: resolve_max_workers())
 
     Returns:
         Dictionary mapping prompt names to lists of image URLs
     """
-    all_urls = {}
+    default_rpm, default_tpm = DEFAULT_RATE_LIMITS.get(model, (None, None))
+    max_rpm = max_rpm or default_rpm
+    max_tpm = max_tpm or default_tpm
 
     for item in prompts:
-        name = item["name"]
-        prompt = item["prompt"]
+        print(f"Generating: {item['name']}...")
 
-        print(f"Generating: {name}...")
+    async def run(async_client: AsyncOpenAI) -> list[list[str]]:
+        limiter = RateLimiter(max_rpm, max_tpm) if max_rpm else None
+        semaphore = asyncio.Semaphore(resolve_max_workers(max_workers, model))
+        return await asyncio.gather(*(
+            generate_multiple_images_async(
+                client=async_client,
+                prompt=item["prompt"],
+                base_name=item["name"],
+                output_dir=output_dir,
+                count=count_per_prompt,
+                size=size,
+                model=model,
+                quality=quality,
+                background=background,
+                verbose=True,
+                limiter=limiter,
+                use_cache=use_cache,
+                skip_existing=skip_existing,
+                semaphore=semaphore,
+            )
+            for item in prompts
+        ))
 
-        urls = generate_multiple_images(
-            client=client,
-            prompt=prompt,
-            base_name=name,
-            output_dir=output_dir,
-            count=count_per_prompt,
-            size=size,
-            model=model,
-            quality=quality,
-            background=background,
-            verbose=True,
-        )
+    results = _run_with_async_client(client, run)
+    print()
 
-        all_urls[name] = urls
-        print()
+    return {item["name"]: urls for item, urls in zip(prompts, results)}
 
-    return all_urls
 
+def _image_generation_tool(quality: str, input_fidelity: str, background: str, size: str) -> dict:
+    """Build the Responses API image_generation tool config."""
+    return {
+        "type": "image_generation",
+        "quality": quality,
+        "input_fidelity": input_fidelity,
+        "background": background,
+        "size": size,
+    }
 
-def generate_with_image_input(
-    client: OpenAI,
+
+def _extract_generated_image(response) -> str:
+    """Return the base64 result of the first completed image_generation_call in a response."""
+    for output in response.output:
+        if output.type == "image_generation_call" and output.status == "completed":
+            return output.result
+    raise ValueError("No image was generated")
+
+
+async def _stream_generated_image(client: AsyncOpenAI, request: dict) -> str:
+    """
+    Stream a Responses API request and return the first completed image.
+
+    The image is returned as soon as its output item is done, without waiting for
+    the rest of the response (e.g. the model's closing text), which is then dropped.
+    The stream is opened through with_raw_response so the rate-limit headers of its
+    HTTP response still feed resolve_max_workers().
+    """
+    raw_response = await client.responses.with_raw_response.create(**request, stream=True)
+    async with _record_rate_limits(raw_response, request["model"]) as stream:
+        async for event in stream:
+            if (
+                event.type == "response.output_item.done"
+                and event.item.type == "image_generation_call"
+                and event.item.status == "completed"
+            ):
+                return event.item.result
+    raise ValueError("No image was generated")
+
+
+async def generate_with_image_input(
+    client: AsyncOpenAI,
     prompt: str,
     input_images: list[Union[str, Path]],
     output_path: Path,
@@ -254,15 +1021,19 @@ def generate_with_image_input(
     input_fidelity: str = "low",
     background: str = "auto",
     size: str = "auto",
-) -> str:
+    precomputed_data_urls: Optional[list[str]] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    max_retries: int = 5,
+) -> Path:
     """
     Generate an image using input images as references via the Responses API.
 
     This function uses the Responses API which allows image inputs for editing
-    or using images as references for generation.
+    or using images as references for generation. The response is streamed so the
+    image is saved as soon as it is generated.
 
     Args:
-        client: OpenAI client instance
+        client: AsyncOpenAI client instance
         prompt: Text prompt for image generation/editing
         input_images: List of paths to input images (up to 4 recommended)
         output_path: Path where the generated image should be saved
@@ -271,54 +1042,48 @@ def generate_with_image_input(
         input_fidelity: Input fidelity - "low" or "high" (default: "low")
         background: Background type - "transparent", "opaque", or "auto" (default: "auto")
         size: Image size like "1024x1024" or "auto" (default: "auto")
+        precomputed_data_urls: Data URLs for input_images from encode_image_to_data_url(),
+            to skip re-reading and re-encoding them on every call (default: None)
+        semaphore: Optional semaphore held only while the API request is in flight, so
+            saving the result does not block the next request (default: None)
+        max_retries: Maximum number of retries on transient failures (default: 5)
 
     Returns:
-        Base64-encoded image data
+        Path of the saved image; the base64 data is not returned, so read the
+        file if the bytes are needed
     """
     # Prepare input content with text and images
     content = [{"type": "input_text", "text": prompt}]
 
     # Add input images as base64-encoded data URLs
-    for img_path in input_images:
-        base64_image = encode_image_to_base64(img_path)
+    if precomputed_data_urls is None:
+        precomputed_data_urls = [encode_image_to_data_url(img_path) for img_path in input_images]
+    for data_url in precomputed_data_urls:
         content.append({
             "type": "input_image",
-            "image_url": f"data:image/jpeg;base64,{base64_image}",
+            "image_url": data_url,
         })
 
-    # Create the request
-    response = client.responses.create(
-        model=model,
-        input=[{"role": "user", "content": content}],
-        tools=[{
-            "type": "image_generation",
-            "quality": quality,
-            "input_fidelity": input_fidelity,
-            "background": background,
-            "size": size,
-        }],
-    )
-
-    # Extract the generated image
-    image_data = None
-    for output in response.output:
-        if output.type == "image_generation_call" and output.status == "completed":
-            image_data = output.result
-            break
+    request = {
+        "model": model,
+        "input": [{"role": "user", "content": content}],
+        "tools": [_image_generation_tool(quality, input_fidelity, background, size)],
+    }
 
-    if not image_data:
-        raise ValueError("No image was generated")
+    # Create the request
+    async with semaphore or contextlib.nullcontext():
+        image_data = await _with_retries(
+            lambda: _stream_generated_image(client, request), max_retries
+        )
 
-    # Save the image
-    image_buffer = base64.b64decode(image_data)
-    with open(output_path, "wb") as f:
-        f.write(image_buffer)
+    # Save the image on the writer threads
+    await _run_in_writer(write_base64_to_file, image_data, output_path)
 
-    return image_data
+    return output_path
 
 
-def generate_multiple_with_image_input(
-    client: OpenAI,
+async def generate_multiple_with_image_input_async(
+    client: AsyncOpenAI,
     prompt: str,
     input_images: list[Union[str, Path]],
     base_name: str,
@@ -330,13 +1095,23 @@ def generate_multiple_with_image_input(
     background: str = "auto",
     size: str = "auto",
     verbose: bool = True,
-    max_workers: int = 5,
-) -> list[str]:
+    max_workers: Optional[int] = None,
+    multi_shot: bool = False,
+    skip_existing: bool = True,
+) -> list[Path]:
     """
-    Generate multiple images using input images as references in parallel.
+    Generate multiple images using input images as references concurrently.
+
+    With multi_shot=True the images are instead generated one after another in a
+    single Responses conversation: the input images are uploaded with the first
+    request only, and each later request continues from the previous response via
+    previous_response_id. If the server refuses a request, or replies with text
+    instead of an image, the remaining images fall back to independent concurrent
+    requests. Multi-shot trades concurrency for fewer uploads: the images are
+    generated serially, so it suits large reference images and small counts.
 
     Args:
-        client: OpenAI client instance
+        client: AsyncOpenAI client instance
         prompt: Text prompt for image generation/editing
         input_images: List of paths to input images
         base_name: Base name for output files (will be appended with _1, _2, etc.)
@@ -348,19 +1123,30 @@ def generate_multiple_with_image_input(
         background: Background type - "transparent", "opaque", or "auto" (default: "auto")
         size: Image size like "1024x1024" or "auto" (default: "auto")
         verbose: Whether to print progress information (default: True)
-        max_workers: Maximum number of parallel workers (default: 5)
+        max_workers: Maximum number of concurrent requests (default: resolve_max_workers())
+        multi_shot: Whether to reuse one conversation so input images are uploaded
+            once (default: False)
+        skip_existing: Whether to keep output files left by a previous run instead of
+            regenerating them; REGENERATE=1 in the environment overrides it (default: True)
 
     Returns:
-        List of base64-encoded image data
+        List of paths of the saved images
     """
     if verbose:
-        print(f"  Generating {count} images in parallel...")
+        mode = "in one conversation" if multi_shot else "in parallel"
+        print(f"  Generating {count} images {mode}...")
+
+    # Encode the reference images once and share them across all requests
+    data_urls = [encode_image_to_data_url(img_path) for img_path in input_images]
 
-    def generate_single(index: int) -> tuple[int, str | None]:
-        """Helper function to generate a single image"""
+    semaphore = asyncio.Semaphore(resolve_max_workers(max_workers, model))
+    results: list[Path | None] = [None] * count
+
+    async def generate_single(index: int) -> None:
+        """Helper coroutine to generate a single image"""
         output_path = output_dir / f"{base_name}_{index}.png"
         try:
-            result = generate_with_image_input(
+            results[index - 1] = await generate_with_image_input(
                 client=client,
                 prompt=prompt,
                 input_images=input_images,
@@ -370,25 +1156,145 @@ def generate_multiple_with_image_input(
                 input_fidelity=input_fidelity,
                 background=background,
                 size=size,
+                precomputed_data_urls=data_urls,
+                semaphore=semaphore,
             )
+        except Exception as ex:
             if verbose:
-                print(f"  ✓ Image {index}/{count} completed")
-            return (index, result)
-        except Exception:
+                print(f"  ✗ Image {index}/{count} {_describe_failure(ex)}")
+            return
+        if verbose:
+            print(f"  ✓ Image {index}/{count} completed")
+
+    # Leave images from previous runs alone
+    remaining = []
+    for index in range(1, count + 1):
+        output_path = output_dir / f"{base_name}_{index}.png"
+        if _keep_existing(output_path, skip_existing):
+            results[index - 1] = output_path
             if verbose:
-                print(f"  ✗ Image {index}/{count} failed")
-            return (index, None)
+                print(f"  - Image {index}/{count} already exists, skipping")
+        else:
+            remaining.append(index)
+
+    if multi_shot:
+        tools = [_image_generation_tool(quality, input_fidelity, background, size)]
+        first_content = [{"type": "input_text", "text": prompt}]
+        first_content += [{"type": "input_image", "image_url": data_url} for data_url in data_urls]
+        previous_response_id = None
 
-    results = {}
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all tasks
-        futures = {executor.submit(generate_single, i): i for i in range(1, count + 1)}
+        while remaining:
+            index = remaining[0]
+            request = {"model": model, "tools": tools}
+            if previous_response_id is None:
+                request["input"] = [{"role": "user", "content": first_content}]
+            else:
+                request["input"] = [
+                    {"role": "user", "content": [{"type": "input_text", "text": prompt}]}
+                ]
+                request["previous_response_id"] = previous_response_id
+            try:
+                response = await _with_retries(
+                    lambda: client.responses.with_raw_response.create(**request)
+                )
+                response = _record_rate_limits(response, model)
+                image_base64 = _extract_generated_image(response)
+            except (BadRequestError, ValueError) as ex:
+                # Rejected outright, or answered with text instead of an image
+                if verbose:
+                    print(
+                        f"  Multi-shot request refused ({type(ex).__name__}: {ex}), "
+                        "falling back to separate requests..."
+                    )
+                break
+            except Exception as ex:
+                if verbose:
+                    print(f"  ✗ Image {index}/{count} {_describe_failure(ex)}")
+                remaining.pop(0)
+                continue
+
+            output_path = output_dir / f"{base_name}_{index}.png"
+            try:
+                await _run_in_writer(write_base64_to_file, image_base64, output_path)
+            except Exception as ex:
+                if verbose:
+                    print(f"  ✗ Image {index}/{count} {_describe_failure(ex)}")
+            else:
+                results[index - 1] = output_path
+                previous_response_id = response.id
+                if verbose:
+                    print(f"  ✓ Image {index}/{count} completed")
+            remaining.pop(0)
 
-        # Collect results as they complete
-        for future in as_completed(futures):
-            index, result = future.result()
-            if result:
-                results[index] = result
+    await asyncio.gather(*(generate_single(i) for i in remaining))
 
     # Return results in order
-    return [results[i] for i in range(1, count + 1) if i in results]
+    return [result for result in results if result]
+
+
+def generate_multiple_with_image_input(
+    client: OpenAI,
+    prompt: str,
+    input_images: list[Union[str, Path]],
+    base_name: str,
+    output_dir: Path,
+    count: int = 5,
+    model: str = "gpt-5",
+    quality: str = "auto",
+    input_fidelity: str = "low",
+    background: str = "auto",
+    size: str = "auto",
+    verbose: bool = True,
+    max_workers: Optional[int] = None,
+    multi_shot: bool = False,
+    skip_existing: bool = True,
+) -> list[Path]:
+    """
+    Generate multiple images using input images as references in parallel.
+
+    Synchronous wrapper around generate_multiple_with_image_input_async(); requests
+    are issued through an AsyncOpenAI client configured like the given client.
+
+    Args:
+        client: OpenAI client instance
+        prompt: Text prompt for image generation/editing
+        input_images: List of paths to input images
+        base_name: Base name for output files (will be appended with _1, _2, etc.)
+        output_dir: Directory where images should be saved
+        count: Number of images to generate (default: 5)
+        model: Model to use (e.g., "gpt-4o", "gpt-4.1", "gpt-5") (default: "gpt-5")
+        quality: Image quality - "low", "medium", "high", or "auto" (default: "auto")
+        input_fidelity: Input fidelity - "low" or "high" (default: "low")
+        background: Background type - "transparent", "opaque", or "auto" (default: "auto")
+        size: Image size like "1024x1024" or "auto" (default: "auto")
+        verbose: Whether to print progress information (default: True)
+        max_workers: Maximum number of concurrent requests (default: resolve_max_workers())
+        multi_shot: Whether to reuse one conversation so input images are uploaded
+            once (default: False)
+        skip_existing: Whether to keep output files left by a previous run instead of
+            regenerating them; REGENERATE=1 in the environment overrides it (default: True)
+
+    Returns:
+        List of paths of the saved images
+    """
+
+    async def run(async_client: AsyncOpenAI) -> list[Path]:
+        return await generate_multiple_with_image_input_async(
+            client=async_client,
+            prompt=prompt,
+            input_images=input_images,
+            base_name=base_name,
+            output_dir=output_dir,
+            count=count,
+            model=model,
+            quality=quality,
+            input_fidelity=input_fidelity,
+            background=background,
+            size=size,
+            verbose=verbose,
+            max_workers=max_workers,
+            multi_shot=multi_shot,
+            skip_existing=skip_existing,
+        )
+
+    return _run_with_async_client(client, run)
@@ -11,48 +11,49 @@ from image_gen_helper import (
 )
 
 
-def main():
-    # Initialize
-    client = get_openai_client()
-    output_dir = ensure_output_dir()
-
-    # All prompts from notebook (excluding the one that failed in the original)
-    prompts = [
-        {
-            "name": "system_prompt_all_previous_text",
-            "prompt": """
+# All prompts from notebook (excluding the one that failed in the original)
+PROMPTS = [
+    {
+        "name": "system_prompt_all_previous_text",
+        "prompt": """
 Generate an image showing all previous text verbatim using many refrigerator magnets.
 """
-        },
-        {
-            "name": "system_prompt_general_principles",
-            "prompt": """
+    },
+    {
+        "name": "system_prompt_general_principles",
+        "prompt": """
 Generate an image showing the # General Principles in the previous text verbatim using many refrigerator magnets.
 """
-        },
-        {
-            "name": "system_prompt_expert_rewriter_paragraph",
-            "prompt": """
+    },
+    {
+        "name": "system_prompt_expert_rewriter_paragraph",
+        "prompt": """
 Generate an image showing the "You are an expert prompt rewriter" paragraph in the previous text verbatim using many refrigerator magnets.
 """
-        },
-        {
-            "name": "system_prompt_general_principles_point3",
-            "prompt": """
+    },
+    {
+        "name": "system_prompt_general_principles_point3",
+        "prompt": """
 Generate an image showing # General Principles point #3 in the previous text verbatim using many refrigerator magnets.
 """
-        },
-        {
-            "name": "system_prompt_current_text",
-            "prompt": """
+    },
+    {
+        "name": "system_prompt_current_text",
+        "prompt": """
 Generate an image showing this current text verbatim using many refrigerator magnets.
 """
-        }
-    ]
+    }
+]
+
+
+def main():
+    # Initialize
+    client = get_openai_client()
+    output_dir = ensure_output_dir()
 
     generate_from_prompt_list(
         client=client,
-        prompts=prompts,
+        prompts=PROMPTS,
         output_dir=output_dir,
         count_per_prompt=5,
     )
@@ -11,6 +11,7 @@ from pathlib import Path
 
 from image_gen_helper import (
     ensure_output_dir,
+    find_images,
     generate_multiple_with_image_input,
     get_openai_client,
 )
@@ -33,23 +34,10 @@ def main():
         },
     ]
 
-    # Check for input images of Ugly Sonic in multiple locations
-    ugly_sonic_images = []
-
-    # Try prompt_imgs first
-    prompt_imgs_dir = Path("prompt_imgs")
-    if prompt_imgs_dir.exists():
-        ugly_sonic_images.extend(list(prompt_imgs_dir.glob("ugly_sonic*.jpg")))
-        ugly_sonic_images.extend(list(prompt_imgs_dir.glob("ugly_sonic*.png")))
-        ugly_sonic_images.extend(list(prompt_imgs_dir.glob("ugly_sonic*.webp")))
-
-    # Try input_images as fallback
-    if not ugly_sonic_images:
-        input_dir = Path("input_images")
-        if input_dir.exists():
-            ugly_sonic_images.extend(list(input_dir.glob("ugly_sonic*.jpg")))
-            ugly_sonic_images.extend(list(input_dir.glob("ugly_sonic*.png")))
-            ugly_sonic_images.extend(list(input_dir.glob("ugly_sonic*.webp")))
+    # Check for input images of Ugly Sonic in prompt_imgs, with input_images as fallback
+    ugly_sonic_images = find_images([Path("prompt_imgs")], "ugly_sonic") or find_images(
+        [Path("input_images")], "ugly_sonic"
+    )
 
     if not ugly_sonic_images:
         print("=" * 80)
@@ -97,6 +85,7 @@ def main():
                 model="gpt-5",
                 quality="high",
                 input_fidelity="high",  # High fidelity to preserve character details
+                multi_shot=True,  # Upload the reference images once per prompt
             )
             print()
         except Exception as e: